@@ -13,12 +13,17 @@ export type AudioStreamController = {
   onFrame: (callback: (frame: AudioFrame) => void) => void;
 };
 
+// Resolved on the first dictation and reused afterwards. A failed load is not
+// cached so a later attempt can pick up a rebuilt native module.
+let cachedPortAudioModule: typeof import("naudiodon") | null = null;
+
 export const createAudioStream = async (
   options: AudioStreamOptions,
 ): Promise<AudioStreamController> => {
   let portAudioModule: typeof import("naudiodon");
   try {
-    portAudioModule = await import("naudiodon");
+    portAudioModule = cachedPortAudioModule ?? (await import("naudiodon"));
+    cachedPortAudioModule = portAudioModule;
   } catch (error) {
     throw new Error(
       "Audio capture library failed to load. Rebuild native modules (naudiodon) for Electron.",
@@ -37,14 +42,16 @@ export const createAudioStream = async (
     }) => { on: (event: string, handler: (data: Buffer) => void) => void; start: () => void; quit: () => void };
     SampleFormat16Bit: number;
   };
-  const frameSamples = Math.round((options.sampleRateHz * options.frameMs) / 1000);
-  const frameBytes = frameSamples * options.channels * 2;
+  // Read once; the frame callbacks below run for every captured chunk.
+  const { sampleRateHz, channels } = options;
+  const frameSamples = Math.round((sampleRateHz * options.frameMs) / 1000);
+  const frameBytes = frameSamples * channels * 2;
 
   const input = new portAudio.AudioIO({
     inOptions: {
-      channelCount: options.channels,
+      channelCount: channels,
       sampleFormat: portAudio.SampleFormat16Bit,
-      sampleRate: options.sampleRateHz,
+      sampleRate: sampleRateHz,
       deviceId: options.deviceIndex ?? -1,
       closeOnError: true,
     },
@@ -63,8 +70,8 @@ export const createAudioStream = async (
       // Rest of paddedFrame is already zeros (silence)
       onFrame({
         audio: paddedFrame,
-        sample_rate_hz: options.sampleRateHz,
-        channels: options.channels,
+        sample_rate_hz: sampleRateHz,
+        channels,
         sequence: sequence++,
         end_of_stream: false,
       });
@@ -80,8 +87,8 @@ export const createAudioStream = async (
       if (onFrame) {
         onFrame({
           audio: frame,
-          sample_rate_hz: options.sampleRateHz,
-          channels: options.channels,
+          sample_rate_hz: sampleRateHz,
+          channels,
           sequence: sequence++,
           end_of_stream: false,
         });
@@ -1,8 +1,9 @@
 // @vitest-environment node
-import { describe, expect, it, vi } from "vitest";
+import { afterEach, describe, expect, it, vi } from "vitest";
 import { EventEmitter } from "node:events";
 
-import { startBackend } from "./backend";
+import { startBackend, waitForBackendHealth } from "./backend";
+import type { DictationClient } from "./grpc-client";
 import { spawn } from "node:child_process";
 
 vi.mock("node:child_process", () => {
@@ -12,11 +13,15 @@ vi.mock("node:child_process", () => {
         stdout?: EventEmitter;
         stderr?: EventEmitter;
         killed?: boolean;
+        exitCode?: number | null;
+        signalCode?: string | null;
         kill: () => void;
       };
       emitter.stdout = new EventEmitter();
       emitter.stderr = new EventEmitter();
       emitter.killed = false;
+      emitter.exitCode = null;
+      emitter.signalCode = null;
       emitter.kill = () => {
         emitter.killed = true;
       };
@@ -35,6 +40,26 @@ const pythonInfo = {
 };
 
 describe("startBackend", () => {
+  let killSpy: { mockRestore: () => void } | null = null;
+
+  const spyOnProcessKill = () => {
+    const spy = vi.spyOn(process, "kill").mockImplementation(() => true);
+    killSpy = spy;
+    return spy;
+  };
+
+  afterEach(() => {
+    // startBackend registers a process "exit" listener per child that signals
+    // its group; let every mock child exit so none of them outlive the test
+    // and reach the real process.kill.
+    for (const result of vi.mocked(spawn).mock.results) {
+      (result.value as EventEmitter).emit("exit", null, "SIGKILL");
+    }
+    killSpy?.mockRestore();
+    killSpy = null;
+    vi.useRealTimers();
+  });
+
   it("spawns backend and streams output", () => {
     const lines: string[] = [];
     const backend = startBackend(pythonInfo, {
@@ -60,4 +85,136 @@ describe("startBackend", () => {
 
     expect(lines).toEqual(["ready", "warn"]);
   });
+
+  it("joins output lines split across chunks", () => {
+    const lines: string[] = [];
+    const backend = startBackend(pythonInfo, {
+      host: "127.0.0.1",
+      port: 50051,
+      onOutput: (line) => lines.push(line),
+    });
+
+    backend.process.stdout?.emit("data", Buffer.from("Loading mo"));
+    backend.process.stdout?.emit("data", Buffer.from("del...\r\nDownload 10%\rDownload 20%"));
+    expect(lines).toEqual(["Loading model...", "Download 10%"]);
+
+    backend.process.stdout?.emit("end");
+    expect(lines).toEqual(["Loading model...", "Download 10%", "Download 20%"]);
+  });
+
+  it("decodes multi-byte characters split across chunks", () => {
+    const lines: string[] = [];
+    const backend = startBackend(pythonInfo, {
+      host: "127.0.0.1",
+      port: 50051,
+      onOutput: (line) => lines.push(line),
+    });
+
+    const bytes = Buffer.from("Caf\u00e9 ready\n");
+    backend.process.stderr?.emit("data", bytes.subarray(0, 4));
+    backend.process.stderr?.emit("data", bytes.subarray(4));
+
+    expect(lines).toEqual(["Caf\u00e9 ready"]);
+  });
+
+  it.skipIf(process.platform === "win32")(
+    "escalates to SIGKILL when the process group outlives the grace period",
+    async () => {
+      vi.useFakeTimers();
+      const killSpy = spyOnProcessKill();
+      const backend = startBackend(pythonInfo, { host: "127.0.0.1", port: 50051 });
+      (backend.process as unknown as { pid: number }).pid = 4321;
+      const stopped = vi.fn();
+
+      void backend.kill().then(stopped);
+      expect(killSpy).toHaveBeenCalledWith(-4321, "SIGTERM");
+
+      await vi.advanceTimersByTimeAsync(6000);
+      expect(killSpy).toHaveBeenCalledWith(-4321, "SIGKILL");
+      expect(stopped).not.toHaveBeenCalled();
+
+      // Quitting must not hang on a process that never reports its exit.
+      await vi.advanceTimersByTimeAsync(1000);
+      expect(stopped).toHaveBeenCalled();
+      backend.process.emit("exit", null, "SIGKILL");
+    },
+  );
+
+  it.skipIf(process.platform === "win32")("does not escalate once the backend has exited", async () => {
+    vi.useFakeTimers();
+    const killSpy = spyOnProcessKill();
+    const backend = startBackend(pythonInfo, { host: "127.0.0.1", port: 50051 });
+    (backend.process as unknown as { pid: number }).pid = 4321;
+
+    const stopping = backend.kill();
+    backend.process.emit("exit", 0);
+    await expect(stopping).resolves.toBeUndefined();
+    vi.advanceTimersByTime(6000);
+
+    expect(killSpy).toHaveBeenCalledTimes(1);
+  });
+});
+
+describe("waitForBackendHealth", () => {
+  it("polls until the backend reports ready", async () => {
+    vi.useFakeTimers();
+    const GetHealth = vi
+      .fn()
+      .mockRejectedValueOnce(new Error("connect ECONNREFUSED"))
+      .mockResolvedValueOnce({ ready: false, mode: "nemo", detail: "Model not loaded" })
+      .mockResolvedValueOnce({ ready: true, mode: "nemo", detail: "ok" });
+    const client = { GetHealth } as unknown as DictationClient;
+    const errors: number[] = [];
+
+    const waiting = waitForBackendHealth(client, {
+      signal: new AbortController().signal,
+      onError: (_error, attempts) => errors.push(attempts),
+    });
+    await vi.runAllTimersAsync();
+
+    await expect(waiting).resolves.toMatchObject({ ready: true });
+    expect(GetHealth).toHaveBeenCalledTimes(3);
+    expect(errors).toEqual([1]);
+    vi.useRealTimers();
+  });
+
+  it("re-probes as soon as it is woken instead of finishing the backoff", async () => {
+    vi.useFakeTimers();
+    const GetHealth = vi
+      .fn()
+      .mockResolvedValueOnce({ ready: false, mode: "nemo", detail: "Model not loaded" })
+      .mockResolvedValueOnce({ ready: false, mode: "nemo", detail: "Model not loaded" })
+      .mockResolvedValueOnce({ ready: true, mode: "nemo", detail: "ok" });
+    const client = { GetHealth } as unknown as DictationClient;
+    const wake = new EventTarget();
+
+    const waiting = waitForBackendHealth(client, {
+      signal: new AbortController().signal,
+      wake,
+    });
+    // Let the first two probes run; the loop is now in a >= 50 ms backoff.
+    await vi.advanceTimersByTimeAsync(30);
+    expect(GetHealth).toHaveBeenCalledTimes(2);
+
+    wake.dispatchEvent(new Event("wake"));
+    await vi.advanceTimersByTimeAsync(0);
+
+    await expect(waiting).resolves.toMatchObject({ ready: true });
+    expect(GetHealth).toHaveBeenCalledTimes(3);
+    vi.useRealTimers();
+  });
+
+  it("rethrows health errors once the backend has exited", async () => {
+    const client = {
+      GetHealth: vi.fn().mockRejectedValue(new Error("connect ECONNREFUSED")),
+    } as unknown as DictationClient;
+    const exited = new AbortController();
+
+    const waiting = waitForBackendHealth(client, {
+      signal: exited.signal,
+      onError: () => exited.abort(new Error("Backend exited with code 1.")),
+    });
+
+    await expect(waiting).rejects.toThrow("Backend exited with code 1.");
+  });
 });
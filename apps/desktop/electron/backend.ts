@@ -1,8 +1,12 @@
 import { spawn } from "node:child_process";
+import type { ChildProcess } from "node:child_process";
+import net from "node:net";
 import path from "node:path";
+import { StringDecoder } from "node:string_decoder";
 import { BackendDepsError } from "./python-finder";
 import type { PythonInfo } from "./python-finder";
-import { BACKEND_ROOT, SHARED_ROOT } from "./constants";
+import type { DictationClient, HealthStatus } from "./grpc-client";
+import { BACKEND_ROOT, IS_WINDOWS, SHARED_ROOT } from "./constants";
 
 export type BackendStartOptions = {
   host: string;
@@ -15,19 +19,170 @@ export type BackendStartOptions = {
 
 export type BackendProcess = {
   process: ReturnType<typeof spawn>;
-  kill: () => void;
+  kill: () => Promise<void>;
 };
 
+export type BackendHealthOptions = {
+  // Aborted when the backend process exits; wakes the poll loop immediately.
+  signal: AbortSignal;
+  // When set, a plain TCP connect gates each health RPC so no gRPC call is
+  // made while the backend has not yet opened its port.
+  endpoint?: { host: string; port: number };
+  // A "wake" event on this target cuts the current backoff sleep short and
+  // resets the delay, e.g. when the backend logs BACKEND_READY_MARKER.
+  wake?: EventTarget;
+  onHealth?: (health: HealthStatus) => void;
+  onError?: (error: unknown, attempts: number) => void;
+};
+
+// Health polling starts fast so a quick backend start is noticed within tens
+// of milliseconds, then backs off while the model loads so a long first start
+// does not issue a health RPC every few hundred milliseconds.
+const HEALTH_POLL_INITIAL_MS = 25;
+const HEALTH_POLL_MAX_MS = 2000;
+const HEALTH_POLL_BACKOFF = 2;
+// Jitter as a fraction of the current delay.
+const HEALTH_POLL_JITTER = 0.1;
+// Bounds a single health RPC so a stalled channel cannot stretch the poll.
+const HEALTH_RPC_TIMEOUT_MS = 2000;
+
+const PORT_PROBE_TIMEOUT_MS = 100;
+
+// Logged by BackendServer.start() once the model has loaded, at which point
+// GetHealth reports ready.
+export const BACKEND_READY_MARKER = "Model loaded on";
+
+const isPortOpen = (host: string, port: number): Promise<boolean> =>
+  new Promise((resolve) => {
+    const socket = net.connect({ host, port });
+    const done = (open: boolean) => {
+      socket.destroy();
+      resolve(open);
+    };
+    socket.setTimeout(PORT_PROBE_TIMEOUT_MS, () => done(false));
+    socket.once("connect", () => done(true));
+    socket.once("error", () => done(false));
+  });
+
+const sleep = (ms: number, signal: AbortSignal, wake?: EventTarget): Promise<void> =>
+  new Promise((resolve, reject) => {
+    if (signal.aborted) {
+      reject(signal.reason);
+      return;
+    }
+    const cleanup = () => {
+      clearTimeout(timer);
+      signal.removeEventListener("abort", onAbort);
+      wake?.removeEventListener("wake", onWake);
+    };
+    const onAbort = () => {
+      cleanup();
+      reject(signal.reason);
+    };
+    const onWake = () => {
+      cleanup();
+      resolve();
+    };
+    const timer = setTimeout(onWake, ms);
+    signal.addEventListener("abort", onAbort, { once: true });
+    wake?.addEventListener("wake", onWake, { once: true });
+  });
+
+// Splits chunked pipe output into trimmed, non-empty lines. A line that is
+// cut across two chunks is carried over instead of being emitted in halves;
+// a bare "\r" (progress bar redraw) also ends a line. Bytes are decoded as
+// UTF-8 incrementally so a multi-byte character split between chunks
+// survives intact.
+const createLineReader = (onLine: (line: string) => void) => {
+  const decoder = new StringDecoder("utf8");
+  let pending = "";
+  const emit = (line: string) => {
+    const trimmed = line.trim();
+    if (trimmed) {
+      onLine(trimmed);
+    }
+  };
+  return {
+    push: (data: Buffer | string) => {
+      const text = typeof data === "string" ? data : decoder.write(data);
+      const lines = (pending + text).split(/\r\n|\r|\n/);
+      pending = lines.pop() ?? "";
+      lines.forEach(emit);
+    },
+    flush: () => {
+      emit(pending + decoder.end());
+      pending = "";
+    },
+  };
+};
+
+// Slightly longer than the grace period BackendServer.stop() gives in-flight
+// requests.
+const BACKEND_KILL_GRACE_MS = 6000;
+// How long to wait for the exit event after SIGKILL before giving up on it.
+const BACKEND_EXIT_WAIT_MS = 1000;
+
+// NeMo/torch can start helper processes of their own, so the whole tree is
+// taken down rather than just the direct child. Resolves once the child has
+// exited, or at the latest shortly after the SIGKILL deadline.
+const killProcessTree = (child: ChildProcess): Promise<void> => {
+  if (child.exitCode !== null || child.signalCode !== null) {
+    return Promise.resolve();
+  }
+  if (child.pid === undefined) {
+    // Never started, so there is no exit to wait for.
+    child.kill();
+    return Promise.resolve();
+  }
+  const pid = child.pid;
+  return new Promise((resolve) => {
+    const timers: NodeJS.Timeout[] = [];
+    const done = () => {
+      timers.forEach(clearTimeout);
+      child.off("exit", done);
+      resolve();
+    };
+    child.once("exit", done);
+    timers.push(setTimeout(done, BACKEND_KILL_GRACE_MS + BACKEND_EXIT_WAIT_MS));
+
+    if (IS_WINDOWS) {
+      spawn("taskkill", ["/pid", String(pid), "/T", "/F"], {
+        windowsHide: true,
+      }).on("error", () => child.kill());
+      return;
+    }
+    try {
+      // Negative pid targets the process group created by `detached`.
+      process.kill(-pid, "SIGTERM");
+    } catch {
+      child.kill();
+      return;
+    }
+    // SIGTERM lets the server drain in-flight requests; if it is still around
+    // once that grace period is over, force the group down.
+    timers.push(
+      setTimeout(() => {
+        try {
+          process.kill(-pid, "SIGKILL");
+        } catch {
+          // The group is already gone.
+        }
+      }, BACKEND_KILL_GRACE_MS),
+    );
+  });
+};
+
+// The bundled source roots are fixed for the lifetime of the process.
+const BACKEND_PYTHONPATH = [
+  path.join(SHARED_ROOT, "src"),
+  path.join(BACKEND_ROOT, "src"),
+].join(path.delimiter);
+
 const buildPythonPath = (): string => {
-  const paths = [
-    path.join(SHARED_ROOT, "src"),
-    path.join(BACKEND_ROOT, "src"),
-  ];
   const existing = process.env.PYTHONPATH;
-  if (existing) {
-    paths.push(existing);
-  }
-  return paths.join(path.delimiter);
+  return existing
+    ? `${BACKEND_PYTHONPATH}${path.delimiter}${existing}`
+    : BACKEND_PYTHONPATH;
 };
 
 export const startBackend = (
@@ -40,6 +195,9 @@ export const startBackend = (
     PARAKEY_HOST: options.host,
     PARAKEY_PORT: String(options.port),
     PYTHONUNBUFFERED: "1",
+    // The backend exits once our end of its stdin closes, which also covers
+    // this process dying without running any exit handlers.
+    PARAKEY_EXIT_ON_STDIN_CLOSE: "1",
   };
 
   if (options.mode) {
@@ -56,31 +214,100 @@ export const startBackend = (
   const child = spawn(python.executable, cmd, {
     env,
     windowsHide: true,
+    // On POSIX, start a new process group so killProcessTree can signal it.
+    detached: !IS_WINDOWS,
   });
 
-  const handleOutput = (data: Buffer) => {
-    const text = data.toString();
-    for (const line of text.split(/\r?\n/)) {
-      if (!line.trim()) {
-        continue;
-      }
-      options.onOutput?.(line.trim());
+  const attachLineReader = (stream: NodeJS.ReadableStream | null) => {
+    if (!stream) {
+      return;
     }
+    const reader = createLineReader((line) => options.onOutput?.(line));
+    stream.on("data", reader.push);
+    stream.on("end", reader.flush);
   };
 
-  child.stdout?.on("data", handleOutput);
-  child.stderr?.on("data", handleOutput);
+  attachLineReader(child.stdout);
+  attachLineReader(child.stderr);
 
+  // In its own process group the backend no longer receives a terminal's
+  // Ctrl+C, so take it down whenever this process exits.
+  const onParentExit = () => {
+    if (child.exitCode === null && child.signalCode === null && child.pid !== undefined) {
+      try {
+        if (IS_WINDOWS) {
+          child.kill();
+        } else {
+          process.kill(-child.pid, "SIGTERM");
+        }
+      } catch {
+        // Already gone.
+      }
+    }
+  };
+  process.once("exit", onParentExit);
+  child.once("exit", () => process.removeListener("exit", onParentExit));
+
+  let stopping: Promise<void> | null = null;
   return {
     process: child,
     kill: () => {
-      if (!child.killed) {
-        child.kill();
+      if (!stopping) {
+        stopping = killProcessTree(child);
       }
+      return stopping;
     },
   };
 };
 
+export const waitForBackendHealth = async (
+  client: DictationClient,
+  { signal, endpoint, wake, onHealth, onError }: BackendHealthOptions,
+): Promise<HealthStatus> => {
+  let delay = HEALTH_POLL_INITIAL_MS;
+  let attempts = 0;
+  // Tracked outside sleep() too, so a wake that arrives while a probe is in
+  // flight still skips the following backoff.
+  let woken = false;
+  const onWake = () => {
+    woken = true;
+  };
+  wake?.addEventListener("wake", onWake);
+  try {
+    for (;;) {
+      signal.throwIfAborted();
+      try {
+        if (endpoint && !(await isPortOpen(endpoint.host, endpoint.port))) {
+          throw new Error(`Backend is not listening on ${endpoint.host}:${endpoint.port}`);
+        }
+        const health = await client.GetHealth({}, { timeoutMs: HEALTH_RPC_TIMEOUT_MS });
+        onHealth?.(health);
+        if (health.ready) {
+          return health;
+        }
+      } catch (error) {
+        if (signal.aborted) {
+          throw error;
+        }
+        attempts += 1;
+        onError?.(error, attempts);
+      }
+      if (!woken) {
+        const jitter = Math.random() * delay * HEALTH_POLL_JITTER;
+        await sleep(delay + jitter, signal, wake);
+      }
+      if (woken) {
+        woken = false;
+        delay = HEALTH_POLL_INITIAL_MS;
+      } else {
+        delay = Math.min(HEALTH_POLL_MAX_MS, delay * HEALTH_POLL_BACKOFF);
+      }
+    }
+  } finally {
+    wake?.removeEventListener("wake", onWake);
+  }
+};
+
 export const ensureBackendDeps = (python: PythonInfo): void => {
   if (!python.hasTorch || !python.hasNemo || !python.hasGrpc) {
     const missing = [
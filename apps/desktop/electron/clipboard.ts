@@ -1,17 +1,21 @@
 import { clipboard } from "electron";
 import { UiohookKey, uIOhook } from "uiohook-napi";
 
+// Control characters (except tab and newlines) and bidi overrides, stripped in one pass.
 // eslint-disable-next-line no-control-regex
-const CONTROL_PATTERN = /[\u0000-\u0008\u000B\u000C\u000E-\u001F]/g;
-const BIDI_PATTERN = new RegExp("[\\u200E\\u200F\\u202A-\\u202E\\u2066-\\u2069]", "g");
+const STRIP_PATTERN = new RegExp(
+  "[\\u0000-\\u0008\\u000B\\u000C\\u000E-\\u001F\\u200E\\u200F\\u202A-\\u202E\\u2066-\\u2069]",
+  "g",
+);
+const NEWLINE_PATTERN = /\r\n|\r|\n/g;
 
 // Store previous clipboard content to restore after paste
 let previousClipboardText: string | null = null;
 
 export const sanitizeText = (text: string): string => {
-  let sanitized = text.replace(CONTROL_PATTERN, "").replace(BIDI_PATTERN, "");
+  let sanitized = text.replace(STRIP_PATTERN, "");
   sanitized = sanitized.normalize("NFC");
-  sanitized = sanitized.replace(/\r\n/g, "\n").replace(/\r/g, "\n").replace(/\n/g, "\r\n");
+  sanitized = sanitized.replace(NEWLINE_PATTERN, "\r\n");
   // Add trailing space for natural flow between consecutive dictations
   sanitized = sanitized.trimEnd() + " ";
   return sanitized;
@@ -4,6 +4,9 @@ import path from "node:path";
 
 export const IS_DEV = process.env.NODE_ENV === "development";
 
+// Resolved once; the platform cannot change while the process is running.
+export const IS_WINDOWS = process.platform === "win32";
+
 export const APP_ROOT = path.resolve(__dirname, "..");
 
 export const RESOURCES_ROOT = app.isPackaged
@@ -25,7 +25,11 @@ const buildFakeClient = () => {
   };
 
   return class FakeService {
-    GetHealth(_payload: Record<string, never>, cb: (error: Error | null, response: unknown) => void) {
+    GetHealth(
+      _payload: Record<string, never>,
+      _options: { deadline?: Date },
+      cb: (error: Error | null, response: unknown) => void,
+    ) {
       cb(null, { ready: true, detail: "ok", mode: "mock" });
     }
 
@@ -47,6 +51,30 @@ describe("grpc client", () => {
     expect(health.detail).toBe("ok");
   });
 
+  it("sets a call deadline when a timeout is given", async () => {
+    const calls: Array<{ deadline?: Date }> = [];
+    (vi.mocked(makeGenericClientConstructor) as unknown as { mockImplementation: (fn: unknown) => void }).mockImplementation(
+      () =>
+        class {
+          GetHealth(
+            _payload: Record<string, never>,
+            options: { deadline?: Date },
+            cb: (error: Error | null, response: unknown) => void,
+          ) {
+            calls.push(options);
+            cb(null, { ready: true, detail: "ok", mode: "mock" });
+          }
+        },
+    );
+
+    const client = createDictationClient("127.0.0.1", 50051);
+    const before = Date.now();
+    await client.GetHealth({}, { timeoutMs: 1000 });
+
+    expect(calls[0].deadline).toBeInstanceOf(Date);
+    expect(calls[0].deadline?.getTime()).toBeGreaterThanOrEqual(before + 1000);
+  });
+
   it("streams events from gRPC", () => {
     (vi.mocked(makeGenericClientConstructor) as unknown as { mockImplementation: (fn: unknown) => void }).mockImplementation(
       () => buildFakeClient(),
@@ -22,8 +22,16 @@ export type AudioFrame = {
   end_of_stream: boolean;
 };
 
+export type CallOptions = {
+  timeoutMs?: number;
+};
+
 type GrpcDictationClient = {
-  GetHealth: (payload: Record<string, never>, callback: (error: Error | null, response: HealthStatus) => void) => void;
+  GetHealth: (
+    payload: Record<string, never>,
+    options: { deadline?: Date },
+    callback: (error: Error | null, response: HealthStatus) => void,
+  ) => void;
   StreamAudio: () => ClientWritableStream<AudioFrame>;
 };
 
@@ -82,7 +90,7 @@ const deserializeHealthStatus = (data: Buffer): HealthStatus => {
 };
 
 export type DictationClient = {
-  GetHealth: (payload: Record<string, never>) => Promise<HealthStatus>;
+  GetHealth: (payload: Record<string, never>, options?: CallOptions) => Promise<HealthStatus>;
   StreamAudio: () => ClientWritableStream<AudioFrame>;
 };
 
@@ -116,9 +124,11 @@ export const createDictationClient = (host: string, port: number): DictationClie
   const client = new ClientCtor(`${host}:${port}`, credentials.createInsecure());
 
   return {
-    GetHealth: (payload: Record<string, never>) =>
+    GetHealth: (payload: Record<string, never>, options?: CallOptions) =>
       new Promise((resolve, reject) => {
-        client.GetHealth(payload, (error, response) => {
+        const deadline =
+          options?.timeoutMs !== undefined ? new Date(Date.now() + options.timeoutMs) : undefined;
+        client.GetHealth(payload, { deadline }, (error, response) => {
           if (error) {
             reject(error);
             return;
@@ -136,7 +146,7 @@ export const streamAudio = (
   onError: (error: Error) => void,
 ): ClientWritableStream<AudioFrame> => {
   const stream = client.StreamAudio();
-  stream.on("data", (event: DictationEvent) => onEvent(event));
-  stream.on("error", (error: Error) => onError(error));
+  stream.on("data", onEvent);
+  stream.on("error", onError);
   return stream;
 };
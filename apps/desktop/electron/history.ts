@@ -45,7 +45,10 @@ const ensureLoaded = (): void => {
 
 export const addTranscript = (text: string): void => {
   ensureLoaded();
-  history = [...history, text].slice(-MAX_HISTORY);
+  history.push(text);
+  if (history.length > MAX_HISTORY) {
+    history.shift();
+  }
   persistHistory();
 };
 
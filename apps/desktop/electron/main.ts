@@ -2,6 +2,7 @@ import { app, BrowserWindow, dialog, ipcMain, Menu, nativeImage, nativeTheme, Tr
 import fs from "node:fs";
 import path from "node:path";
 import { createDictationClient, streamAudio } from "./grpc-client";
+import type { DictationClient } from "./grpc-client";
 import { createAudioStream } from "./audio";
 import { ensureNativeAudioDeps } from "./native-deps";
 import { registerHoldHotkey, stopHotkeyListener } from "./hotkeys";
@@ -18,7 +19,7 @@ import {
   getPythonInfoForExecutable,
   resolveVenvPython,
 } from "./python-finder";
-import { startBackend } from "./backend";
+import { BACKEND_READY_MARKER, startBackend, waitForBackendHealth } from "./backend";
 import {
   APP_ROOT,
   BACKEND_ROOT,
@@ -34,13 +35,17 @@ let mainWindow: BrowserWindow | null = null;
 let overlayWindow: BrowserWindow | null = null;
 let tray: Tray | null = null;
 let settings = loadSettings();
-let backendProcess: { kill: () => void } | null = null;
+let backendProcess: { kill: () => Promise<void> } | null = null;
 let backendReady = false;
 let audioController: Awaited<ReturnType<typeof createAudioStream>> | null = null;
 let dictationStream: ReturnType<typeof streamAudio> | null = null;
+let dictationClient: { address: string; client: DictationClient } | null = null;
 let dictationActive = false;
 let isQuitting = false;
 let overlayHideTimer: ReturnType<typeof setTimeout> | null = null;
+let partialOverlayTimer: ReturnType<typeof setTimeout> | null = null;
+let pendingPartialText = "";
+let lastPartialOverlayAt = 0;
 
 // Safely send IPC message to main window (handles destroyed window)
 const sendToMain = (channel: string, ...args: unknown[]) => {
@@ -53,6 +58,58 @@ const sendToMain = (channel: string, ...args: unknown[]) => {
   }
 };
 
+// Backend and pip output arrives in bursts of hundreds of lines; forward it
+// to the renderer in batches rather than one IPC message per line.
+const LOG_FLUSH_MS = 30;
+let pendingLogs: string[] = [];
+let logFlushTimer: ReturnType<typeof setTimeout> | null = null;
+
+const flushLogs = () => {
+  logFlushTimer = null;
+  const lines = pendingLogs;
+  pendingLogs = [];
+  sendToMain("backend:log", lines);
+};
+
+const sendLog = (line: string) => {
+  pendingLogs.push(line);
+  if (!logFlushTimer) {
+    logFlushTimer = setTimeout(flushLogs, LOG_FLUSH_MS);
+  }
+};
+
+// During startup a status update follows every backend output line, but only
+// the latest one is shown; send at most one per interval, latest wins.
+const STATUS_FLUSH_MS = 30;
+let pendingStatus: { ready: boolean; detail: string } | null = null;
+let statusFlushTimer: ReturnType<typeof setTimeout> | null = null;
+
+const flushStatus = () => {
+  statusFlushTimer = null;
+  if (pendingStatus) {
+    sendToMain("backend:status", pendingStatus);
+    pendingStatus = null;
+  }
+};
+
+const sendStatus = (status: { ready: boolean; detail: string }) => {
+  pendingStatus = status;
+  if (!statusFlushTimer) {
+    statusFlushTimer = setTimeout(flushStatus, STATUS_FLUSH_MS);
+  }
+};
+
+// Reuse one gRPC channel across health checks and dictation sessions; a new
+// client is only created when the backend address changes.
+const getDictationClient = (): DictationClient => {
+  const { host, port } = settings.backend;
+  const address = `${host}:${port}`;
+  if (dictationClient?.address !== address) {
+    dictationClient = { address, client: createDictationClient(host, port) };
+  }
+  return dictationClient.client;
+};
+
 const getIconPath = () => {
   // In dev, icon is in public folder; in production, it's in dist (renderer output)
   return IS_DEV
@@ -141,7 +198,20 @@ const positionOverlay = (mode: AppSettings["overlay"]["position"]) => {
   overlayWindow.setPosition(x, y, false);
 };
 
+// Partial transcripts can arrive dozens of times per second; the overlay is
+// updated at most this often, always ending on the newest text.
+const PARTIAL_OVERLAY_INTERVAL_MS = 33;
+
+const cancelPartialOverlay = () => {
+  if (partialOverlayTimer) {
+    clearTimeout(partialOverlayTimer);
+    partialOverlayTimer = null;
+  }
+};
+
 const showOverlay = (text: string, mode: "listening" | "processing" | "inserted" | "error") => {
+  // Any direct update supersedes a throttled partial that has not been shown.
+  cancelPartialOverlay();
   if (!settings.overlay.enabled || !overlayWindow) {
     return;
   }
@@ -149,8 +219,10 @@ const showOverlay = (text: string, mode: "listening" | "processing" | "inserted"
     clearTimeout(overlayHideTimer);
     overlayHideTimer = null;
   }
-  positionOverlay(settings.overlay.position);
-  overlayWindow.showInactive();
+  if (!overlayWindow.isVisible()) {
+    positionOverlay(settings.overlay.position);
+    overlayWindow.showInactive();
+  }
   overlayWindow.webContents.send("overlay:update", { text, mode });
   if (mode !== "listening" && settings.overlay.autoHideMs > 0) {
     overlayHideTimer = setTimeout(() => {
@@ -162,7 +234,28 @@ const showOverlay = (text: string, mode: "listening" | "processing" | "inserted"
   }
 };
 
+const showPartialOverlay = (text: string) => {
+  pendingPartialText = text;
+  if (partialOverlayTimer) {
+    return;
+  }
+  const flush = () => {
+    lastPartialOverlayAt = Date.now();
+    showOverlay(pendingPartialText, "listening");
+  };
+  const wait = lastPartialOverlayAt + PARTIAL_OVERLAY_INTERVAL_MS - Date.now();
+  if (wait <= 0) {
+    flush();
+    return;
+  }
+  partialOverlayTimer = setTimeout(() => {
+    partialOverlayTimer = null;
+    flush();
+  }, wait);
+};
+
 const hideOverlay = () => {
+  cancelPartialOverlay();
   overlayWindow?.hide();
 };
 
@@ -221,8 +314,8 @@ const createTray = () => {
 const ensureBackend = async () => {
   const updateStatus = (payload: { status: string }) => {
     sendToMain("install:status", payload);
-    sendToMain("backend:status", { ready: false, detail: payload.status });
-    sendToMain("backend:log", payload.status);
+    sendStatus({ ready: false, detail: payload.status });
+    sendLog(payload.status);
   };
 
   const pipTempDir = path.join(app.getPath("userData"), "pip-temp");
@@ -230,26 +323,25 @@ const ensureBackend = async () => {
   try {
     const venvRoot = path.join(app.getPath("userData"), "python", ".venv");
     const venvPython = resolveVenvPython(venvRoot);
-    const venvInfo = getPythonInfoForExecutable(venvPython, true);
+    const venvInfo = await getPythonInfoForExecutable(venvPython, true);
     if (venvInfo) {
       return venvInfo;
     }
 
     if (fs.existsSync(venvPython)) {
-      sendToMain(
-        "backend:log",
+      sendLog(
         "Existing Python environment uses an unsupported version. Recreating...",
       );
       fs.rmSync(venvRoot, { recursive: true, force: true });
     }
 
-    const basePython = findPython(APP_ROOT, false);
+    const basePython = await findPython(APP_ROOT, false);
     const venvExecutable = ensureVenv(basePython.executable, venvRoot);
     updateStatus({ status: "Preparing Python environment..." });
     await installBackendDepsAsync(venvExecutable, BACKEND_ROOT, pipTempDir, (line) => {
-      sendToMain("backend:log", line);
+      sendLog(line);
     });
-    const ready = getPythonInfoForExecutable(venvExecutable, true);
+    const ready = await getPythonInfoForExecutable(venvExecutable, true);
     if (ready) {
       return ready;
     }
@@ -268,9 +360,9 @@ const ensureBackend = async () => {
       });
       updateStatus({ status: "Missing Python dependencies. Installing..." });
       await installBackendDepsAsync(error.pythonPath, BACKEND_ROOT, pipTempDir, (line) => {
-        sendToMain("backend:log", line);
+        sendLog(line);
       });
-      const venvInfo = getPythonInfoForExecutable(error.pythonPath, true);
+      const venvInfo = await getPythonInfoForExecutable(error.pythonPath, true);
       if (venvInfo) {
         return venvInfo;
       }
@@ -292,7 +384,7 @@ const ensureBackend = async () => {
 const startBackendProcess = async () => {
   const [nativeDepsResult, pythonResult] = await Promise.allSettled([
     ensureNativeAudioDeps((line) => {
-      sendToMain("backend:log", line);
+      sendLog(line);
     }),
     ensureBackend(),
   ]);
@@ -303,72 +395,66 @@ const startBackendProcess = async () => {
   const python = pythonResult.value;
 
   if (nativeDepsResult.status === "rejected" || !nativeDepsResult.value.ok) {
-    sendToMain(
-      "backend:log",
+    sendLog(
       "Audio capture will be unavailable until native modules rebuild successfully.",
     );
-    sendToMain(
-      "backend:log",
+    sendLog(
       "Tip: set PYTHON to Python 3.11 or install setuptools for your Python 3.12 runtime.",
     );
   }
 
-  sendToMain("backend:log", `Using Python: ${python.executable}`);
+  sendLog(`Using Python: ${python.executable}`);
 
+  const backendWake = new EventTarget();
   const backend = startBackend(python, {
     host: settings.backend.host,
     port: settings.backend.port,
     onOutput: (line) => {
-      sendToMain("backend:log", line);
+      sendLog(line);
       // Only send status updates before the backend is ready
       if (!backendReady) {
-        sendToMain("backend:status", {
+        sendStatus({
           ready: false,
           detail: line,
         });
+        if (line.includes(BACKEND_READY_MARKER)) {
+          backendWake.dispatchEvent(new Event("wake"));
+        }
       }
     },
   });
   backendProcess = backend;
-  let backendExited = false;
+  const backendExit = new AbortController();
   backend.process.on("exit", (code) => {
-    backendExited = true;
     const message = `Backend exited with code ${code ?? "unknown"}.`;
-    sendToMain("backend:log", message);
-    sendToMain("backend:status", { ready: false, detail: message });
+    backendExit.abort(new Error(message));
+    sendLog(message);
+    sendStatus({ ready: false, detail: message });
   });
 
-  const grpc = createDictationClient(settings.backend.host, settings.backend.port);
-  let ready = false;
-  let attempts = 0;
-  while (!ready) {
-    try {
-      const health = await grpc.GetHealth({});
-      sendToMain("backend:status", { ready: health.ready, detail: health.detail });
-      ready = health.ready;
+  const grpc = getDictationClient();
+  await waitForBackendHealth(grpc, {
+    signal: backendExit.signal,
+    endpoint: { host: settings.backend.host, port: settings.backend.port },
+    wake: backendWake,
+    onHealth: (health) => {
+      sendStatus({ ready: health.ready, detail: health.detail });
       backendReady = health.ready;
-      if (!ready) {
-        await new Promise((resolve) => setTimeout(resolve, 500));
-      }
-    } catch (error) {
-      if (backendExited) {
-        throw error;
-      }
-      attempts += 1;
+    },
+    onError: (error, attempts) => {
       const message = "Waiting for backend...";
-      sendToMain("backend:status", {
+      sendStatus({
         ready: false,
         detail: message,
       });
       if (attempts === 1) {
         const errorMessage = error instanceof Error ? error.message : "Health check failed";
-        sendToMain("backend:log", `Health check failed: ${errorMessage}`);
+        sendLog(`Health check failed: ${errorMessage}`);
       } else if (attempts % 5 === 0) {
-        sendToMain("backend:log", `${message} (${attempts})`);
+        sendLog(`${message} (${attempts})`);
       }
-      await new Promise((resolve) => setTimeout(resolve, 500));
-    }
-  }
+    },
+  });
 };
 
 const startDictation = async () => {
@@ -379,12 +465,12 @@ const startDictation = async () => {
   sendToMain("dictation:state", { state: "RECORDING" });
   showOverlay("Listening...", "listening");
 
-  const grpc = createDictationClient(settings.backend.host, settings.backend.port);
+  const grpc = getDictationClient();
   const stream = streamAudio(
     grpc,
     (event) => {
       if (event.partial) {
-        showOverlay(event.partial.text || "Listening...", "listening");
+        showPartialOverlay(event.partial.text || "Listening...");
       }
       if (event.final) {
         const sanitized = sanitizeText(event.final.text);
@@ -415,7 +501,7 @@ const startDictation = async () => {
     });
   } catch (error) {
     const message = error instanceof Error ? error.message : "Audio capture failed.";
-    sendToMain("backend:log", message);
+    sendLog(message);
     sendToMain("dictation:state", { state: "ERROR" });
     showOverlay(message, "error");
     return;
@@ -457,7 +543,7 @@ const stopDictation = async () => {
   if (stream) {
     await new Promise<void>((resolve) => {
       const timeout = setTimeout(() => {
-        sendToMain("backend:log", "Transcription timeout");
+        sendLog("Transcription timeout");
         resolve();
       }, 30000);
 
@@ -521,8 +607,8 @@ const startApp = async () => {
   wireIpc();
   await waitForRenderer();
   sendToMain("startup:cache", { path: PYTHON_CACHE_PATH });
-  sendToMain("backend:status", { ready: false, detail: "Initializing..." });
-  sendToMain("backend:log", "Initializing backend...");
+  sendStatus({ ready: false, detail: "Initializing..." });
+  sendLog("Initializing backend...");
   await startBackendProcess();
 
   registerHoldHotkey(
@@ -537,13 +623,13 @@ const startApp = async () => {
     autoUpdater.autoDownload = true;
     autoUpdater.autoInstallOnAppQuit = true;
     autoUpdater.on("update-available", (info) => {
-      sendToMain("backend:log", `Update available: v${info.version}`);
+      sendLog(`Update available: v${info.version}`);
     });
     autoUpdater.on("update-downloaded", (info) => {
-      sendToMain("backend:log", `Update v${info.version} downloaded. It will be installed on quit.`);
+      sendLog(`Update v${info.version} downloaded. It will be installed on quit.`);
     });
     autoUpdater.on("error", (err) => {
-      sendToMain("backend:log", `Auto-update error: ${err.message}`);
+      sendLog(`Auto-update error: ${err.message}`);
     });
     autoUpdater.checkForUpdatesAndNotify();
   }
@@ -551,18 +637,34 @@ const startApp = async () => {
 
 process.on("unhandledRejection", (reason) => {
   const message = reason instanceof Error ? reason.message : "Unhandled rejection";
-  sendToMain("backend:log", `Unhandled: ${message}`);
+  sendLog(`Unhandled: ${message}`);
 });
 
+// The backend runs in its own process group, so a terminal Ctrl+C (e.g. under
+// `bun dev`) only reaches us; quit normally so it is stopped as well.
+for (const signal of ["SIGINT", "SIGTERM", "SIGHUP"] as const) {
+  process.on(signal, () => app.quit());
+}
+
 app.whenReady().then(startApp);
 
 app.on("window-all-closed", () => {
   // Keep the app running in the tray on Windows.
 });
 
-app.on("before-quit", () => {
-  isQuitting = true;
-  stopHotkeyListener();
-  backendProcess?.kill();
-  tray?.destroy();
+app.on("before-quit", (event) => {
+  if (!isQuitting) {
+    isQuitting = true;
+    stopHotkeyListener();
+    tray?.destroy();
+  }
+  const backend = backendProcess;
+  if (backend) {
+    // Hold the quit until the backend is gone; one stuck loading the model
+    // would otherwise outlive us and keep the port. killProcessTree resolves
+    // by the SIGKILL deadline at the latest.
+    event.preventDefault();
+    backendProcess = null;
+    void backend.kill().finally(() => app.quit());
+  }
 });
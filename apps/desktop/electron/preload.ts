@@ -2,8 +2,9 @@ import { contextBridge, ipcRenderer } from "electron";
 import type { AppSettings } from "./settings";
 
 contextBridge.exposeInMainWorld("parakey", {
-  onBackendLog: (callback: (line: string) => void) => {
-    const handler = (_event: Electron.IpcRendererEvent, line: string) => callback(line);
+  onBackendLog: (callback: (lines: string[]) => void) => {
+    // Log lines arrive batched from the main process; pass each batch on whole.
+    const handler = (_event: Electron.IpcRendererEvent, lines: string[]) => callback(lines);
     ipcRenderer.on("backend:log", handler);
     return () => ipcRenderer.removeListener("backend:log", handler);
   },
@@ -0,0 +1,243 @@
+// @vitest-environment node
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+import fs from "node:fs";
+import os from "node:os";
+import path from "node:path";
+import { execFile, execFileSync } from "node:child_process";
+
+const userData = vi.hoisted(() => ({ dir: "" }));
+
+vi.mock("electron", () => ({
+  app: { getPath: () => userData.dir },
+}));
+
+// Exercise the Windows lookups (python.exe, the py launcher) on any host.
+vi.mock("./constants", () => ({ IS_WINDOWS: true }));
+
+vi.mock("node:child_process", () => ({
+  execFile: vi.fn(),
+  execFileSync: vi.fn(),
+  spawn: vi.fn(),
+}));
+
+import { clearPythonFinderCache, findPython } from "./python-finder";
+
+type ExecFileCallback = (error: Error | null, stdout: string, stderr: string) => void;
+
+// Answers each interpreter probe with the handler's stdout, or fails it on null.
+const answerProbes = (
+  handler: (file: string, options: { signal?: AbortSignal }, callback: ExecFileCallback) => string | null | void,
+) => {
+  vi.mocked(execFile).mockImplementation(((
+    file: string,
+    _args: string[],
+    options: { signal?: AbortSignal },
+    callback: ExecFileCallback,
+  ) => {
+    const stdout = handler(file, options, callback);
+    if (stdout !== undefined) {
+      callback(stdout === null ? new Error("probe failed") : null, stdout ?? "", "");
+    }
+  }) as unknown as typeof execFile);
+};
+
+let root = "";
+
+const makePython = (...segments: string[]): string => {
+  const executable = path.join(root, ...segments, "python.exe");
+  fs.mkdirSync(path.dirname(executable), { recursive: true });
+  fs.writeFileSync(executable, "");
+  fs.chmodSync(executable, 0o755);
+  return executable;
+};
+
+beforeEach(() => {
+  root = fs.mkdtempSync(path.join(os.tmpdir(), "parakey-finder-"));
+  userData.dir = path.join(root, "userData");
+  vi.stubEnv("PATH", "");
+  vi.stubEnv("PARAKEY_PYTHON", "");
+  vi.stubEnv("VIRTUAL_ENV", "");
+  vi.stubEnv("CONDA_PREFIX", "");
+  vi.stubEnv("LOCALAPPDATA", "");
+  vi.mocked(execFile).mockReset();
+  vi.mocked(execFileSync).mockReset();
+  vi.mocked(execFileSync).mockImplementation(() => {
+    throw new Error("py not found");
+  });
+  clearPythonFinderCache();
+});
+
+afterEach(() => {
+  vi.unstubAllEnvs();
+  fs.rmSync(root, { recursive: true, force: true });
+});
+
+describe("findPython", () => {
+  it("aborts the remaining probes once a candidate qualifies", async () => {
+    const envPython = makePython("env");
+    const pathPython = makePython("path");
+    vi.stubEnv("PARAKEY_PYTHON", envPython);
+    vi.stubEnv("PATH", path.dirname(pathPython));
+    let pathSignal: AbortSignal | undefined;
+    answerProbes((file, options, callback) => {
+      if (file === envPython) {
+        return "3.12";
+      }
+      // Leave the PATH probe hanging until it is aborted.
+      pathSignal = options.signal;
+      options.signal?.addEventListener("abort", () => callback(new Error("aborted"), "", ""));
+    });
+
+    await expect(findPython(root, false)).resolves.toMatchObject({ executable: envPython });
+    expect(pathSignal?.aborted).toBe(true);
+  });
+
+  it("does not start the py launcher when an earlier candidate qualifies", async () => {
+    const envPython = makePython("env");
+    vi.stubEnv("PARAKEY_PYTHON", envPython);
+    answerProbes(() => "3.12");
+
+    await findPython(root, false);
+
+    expect(execFileSync).not.toHaveBeenCalled();
+  });
+
+  it("falls back to the py launcher when nothing earlier qualifies", async () => {
+    const oldPython = makePython("env");
+    const launcherPython = makePython("launcher");
+    vi.stubEnv("PARAKEY_PYTHON", oldPython);
+    vi.mocked(execFileSync).mockReturnValue(` -V:3.12 *        ${launcherPython}\n`);
+    answerProbes((file) => (file === oldPython ? "3.9" : "3.12"));
+
+    await expect(findPython(root, false)).resolves.toMatchObject({ executable: launcherPython });
+  });
+
+  it("reuses finder results until clearPythonFinderCache is called", async () => {
+    const launcherPython = makePython("launcher");
+    vi.mocked(execFileSync).mockReturnValue(` -V:3.12 *        ${launcherPython}\n`);
+    answerProbes(() => "3.12");
+
+    await findPython(root, false);
+    await findPython(root, false);
+    expect(execFileSync).toHaveBeenCalledTimes(1);
+
+    clearPythonFinderCache();
+    await findPython(root, false);
+    expect(execFileSync).toHaveBeenCalledTimes(2);
+  });
+});
+
+describe("py launcher lookup", () => {
+  it("reads installs from newer `py -0p` output", async () => {
+    const python311 = makePython("py311");
+    const python312 = makePython("py312");
+    vi.mocked(execFileSync).mockReturnValue(
+      [
+        ` -V:3.11 *        ${python311}`,
+        ` -V:3.12          ${python312}`,
+        "",
+      ].join("\r\n"),
+    );
+    answerProbes(() => "3.12");
+
+    await expect(findPython(root, false)).resolves.toMatchObject({ executable: python312 });
+  });
+
+  it("reads installs from older `py -0p` output with a trailing default marker", async () => {
+    const python311 = makePython("Program Files", "Python 3.11");
+    vi.mocked(execFileSync).mockReturnValue(
+      ["Installed Pythons found by py Launcher for Windows", ` -3.11-64        ${python311} *`, ""].join(
+        "\r\n",
+      ),
+    );
+    answerProbes(() => "3.11");
+
+    await expect(findPython(root, false)).resolves.toMatchObject({ executable: python311 });
+  });
+
+  it("asks per version when `py -0p` fails", async () => {
+    const python311 = makePython("py311");
+    vi.mocked(execFileSync).mockImplementation(((_file: string, args: string[]) => {
+      if (args[0] === "-3.11") {
+        return `${python311}\r\n`;
+      }
+      throw new Error(`unsupported: ${args.join(" ")}`);
+    }) as unknown as typeof execFileSync);
+    answerProbes(() => "3.11");
+
+    await expect(findPython(root, false)).resolves.toMatchObject({ executable: python311 });
+    expect(vi.mocked(execFileSync).mock.calls.map((call) => call[1]?.[0])).toEqual([
+      "-0p",
+      "-3.12",
+      "-3.11",
+    ]);
+  });
+});
+
+describe("interpreter probes", () => {
+  const fullProbe = (sitePackages: string) =>
+    JSON.stringify({
+      version: "3.12",
+      hasTorch: true,
+      hasNemo: true,
+      hasGrpc: true,
+      hasCuda: false,
+      sitePackages,
+    });
+
+  it("reuses a full probe until site-packages changes", async () => {
+    const python = makePython("env");
+    const sitePackages = path.join(root, "site-packages");
+    fs.mkdirSync(sitePackages);
+    vi.stubEnv("PARAKEY_PYTHON", python);
+    answerProbes(() => fullProbe(sitePackages));
+
+    await findPython(root);
+    await findPython(root);
+    expect(execFile).toHaveBeenCalledTimes(1);
+
+    const later = new Date(Date.now() + 60_000);
+    fs.utimesSync(sitePackages, later, later);
+    await findPython(root);
+    expect(execFile).toHaveBeenCalledTimes(2);
+  });
+
+  it("re-probes when the interpreter itself changes", async () => {
+    const python = makePython("env");
+    const sitePackages = path.join(root, "site-packages");
+    fs.mkdirSync(sitePackages);
+    vi.stubEnv("PARAKEY_PYTHON", python);
+    answerProbes(() => fullProbe(sitePackages));
+
+    await findPython(root);
+    const later = new Date(Date.now() + 60_000);
+    fs.utimesSync(python, later, later);
+    await findPython(root);
+
+    expect(execFile).toHaveBeenCalledTimes(2);
+  });
+
+  it("takes the version from a PythonXY install directory without starting it", async () => {
+    const python = makePython("Python312");
+    vi.stubEnv("PARAKEY_PYTHON", python);
+
+    await expect(findPython(root, false)).resolves.toMatchObject({
+      executable: python,
+      version: "3.12",
+    });
+    expect(execFile).not.toHaveBeenCalled();
+  });
+});
+
+describe("PATH lookup", () => {
+  it("skips empty and missing entries and strips quotes", async () => {
+    const python = makePython("quoted dir");
+    vi.stubEnv(
+      "PATH",
+      ["", path.join(root, "missing"), `"${path.dirname(python)}"`].join(path.delimiter),
+    );
+    answerProbes(() => "3.12");
+
+    await expect(findPython(root, false)).resolves.toMatchObject({ executable: python });
+  });
+});
@@ -1,6 +1,8 @@
+import { app } from "electron";
 import path from "node:path";
-import { execFileSync, spawn, spawnSync } from "node:child_process";
+import { execFile, execFileSync, spawn } from "node:child_process";
 import fs from "node:fs";
+import { IS_WINDOWS } from "./constants";
 
 export type PythonInfo = {
   executable: string;
@@ -22,21 +24,25 @@ export class BackendDepsError extends Error {
   }
 }
 
-const runPythonCheck = (pythonPath: string, code: string): string | null => {
-  try {
-    const result = spawnSync(pythonPath, ["-c", code], {
-      encoding: "utf-8",
-      timeout: 30000,
-      windowsHide: true,
-    });
-    if (result.status === 0) {
-      return result.stdout.trim();
+// Runs without blocking the main process so several candidates can be probed
+// at once; resolves null on a non-zero exit, timeout, spawn failure or abort.
+const runPythonCheck = (
+  pythonPath: string,
+  code: string,
+  signal?: AbortSignal,
+): Promise<string | null> =>
+  new Promise((resolve) => {
+    try {
+      execFile(
+        pythonPath,
+        ["-c", code],
+        { encoding: "utf-8", timeout: 30000, windowsHide: true, signal },
+        (error, stdout) => resolve(error ? null : stdout.trim()),
+      );
+    } catch {
+      resolve(null);
     }
-    return null;
-  } catch {
-    return null;
-  }
-};
+  });
 
 type PythonCheckResult = {
   version: string;
@@ -44,17 +50,119 @@ type PythonCheckResult = {
   hasNemo: boolean;
   hasGrpc: boolean;
   hasCuda: boolean;
+  sitePackages: string;
 };
 
-const getAllPythonInfo = (pythonPath: string): PythonCheckResult | null => {
+// Full probe results persisted across launches. An entry is reused while
+// neither the interpreter nor its site-packages directory has been modified;
+// pip adds or removes package directories there, which bumps its mtime.
+type ProbeCacheEntry = {
+  exeMtimeMs: number;
+  sitePackagesMtimeMs: number;
+  result: PythonCheckResult;
+};
+
+const MAX_PROBE_CACHE_ENTRIES = 32;
+
+let probeCache: Record<string, ProbeCacheEntry> | null = null;
+
+const getProbeCachePath = (): string =>
+  path.join(app.getPath("userData"), "python-probe-cache.json");
+
+const getMtimeMs = (filePath: string): number | null => {
+  try {
+    return fs.statSync(filePath).mtimeMs;
+  } catch {
+    return null;
+  }
+};
+
+const loadProbeCache = (): Record<string, ProbeCacheEntry> => {
+  if (!probeCache) {
+    try {
+      const parsed: unknown = JSON.parse(fs.readFileSync(getProbeCachePath(), "utf-8"));
+      probeCache =
+        parsed && typeof parsed === "object" ? (parsed as Record<string, ProbeCacheEntry>) : {};
+    } catch {
+      probeCache = {};
+    }
+  }
+  return probeCache;
+};
+
+const getCachedProbe = (pythonPath: string): PythonCheckResult | null => {
+  const entry = loadProbeCache()[pythonPath];
+  if (
+    !entry?.result ||
+    entry.exeMtimeMs !== getMtimeMs(pythonPath) ||
+    entry.sitePackagesMtimeMs !== getMtimeMs(entry.result.sitePackages)
+  ) {
+    return null;
+  }
+  return entry.result;
+};
+
+const storeProbe = (pythonPath: string, result: PythonCheckResult): void => {
+  const exeMtimeMs = getMtimeMs(pythonPath);
+  const sitePackagesMtimeMs = getMtimeMs(result.sitePackages);
+  if (exeMtimeMs === null || sitePackagesMtimeMs === null) {
+    return;
+  }
+  const cache = loadProbeCache();
+  delete cache[pythonPath];
+  cache[pythonPath] = { exeMtimeMs, sitePackagesMtimeMs, result };
+  // Keys keep insertion order, so the oldest entries come first.
+  const keys = Object.keys(cache);
+  for (const key of keys.slice(0, Math.max(0, keys.length - MAX_PROBE_CACHE_ENTRIES))) {
+    delete cache[key];
+  }
+  try {
+    const filePath = getProbeCachePath();
+    fs.mkdirSync(path.dirname(filePath), { recursive: true });
+    fs.writeFileSync(filePath, JSON.stringify(cache), "utf-8");
+  } catch (error) {
+    console.warn("Failed to persist Python probe cache:", error);
+  }
+};
+
+let nvidiaDriverPresent: boolean | null = null;
+
+const hasNvidiaDriver = (): boolean => {
+  if (nvidiaDriverPresent === null) {
+    if (IS_WINDOWS) {
+      const systemRoot = process.env.SystemRoot ?? "C:\\Windows";
+      nvidiaDriverPresent = fs.existsSync(path.join(systemRoot, "System32", "nvcuda.dll"));
+    } else if (process.platform === "linux") {
+      nvidiaDriverPresent = fs.existsSync("/proc/driver/nvidia/version");
+    } else {
+      nvidiaDriverPresent = false;
+    }
+  }
+  return nvidiaDriverPresent;
+};
+
+const getAllPythonInfo = async (
+  pythonPath: string,
+  signal?: AbortSignal,
+): Promise<PythonCheckResult | null> => {
+  const cached = getCachedProbe(pythonPath);
+  if (cached) {
+    return cached;
+  }
+
+  // torch.cuda.is_available() loads the CUDA runtime, which is slow; skip it
+  // when there is no NVIDIA driver for it to find.
+  const cudaCheck = hasNvidiaDriver()
+    ? "        info['hasCuda'] = torch.cuda.is_available()"
+    : "        pass";
   const script = [
-    "import sys, json",
-    "info = {'version': f'{sys.version_info.major}.{sys.version_info.minor}', 'hasTorch': False, 'hasNemo': False, 'hasGrpc': False, 'hasCuda': False}",
+    "import sys, json, sysconfig",
+    "info = {'version': f'{sys.version_info.major}.{sys.version_info.minor}', 'hasTorch': False, 'hasNemo': False, 'hasGrpc': False, 'hasCuda': False, 'sitePackages': sysconfig.get_paths()['purelib']}",
     "try:",
     "    import torch",
     "    info['hasTorch'] = True",
     "    try:",
-    "        info['hasCuda'] = torch.cuda.is_available()",
+    cudaCheck,
     "    except Exception:",
     "        pass",
     "except Exception:",
@@ -68,36 +176,59 @@ const getAllPythonInfo = (pythonPath: string): PythonCheckResult | null => {
     "print(json.dumps(info))",
   ].join("\n");
 
-  const output = runPythonCheck(pythonPath, script);
+  const output = await runPythonCheck(pythonPath, script, signal);
   if (!output) {
     return null;
   }
+  let result: PythonCheckResult;
   try {
-    return JSON.parse(output) as PythonCheckResult;
+    result = JSON.parse(output) as PythonCheckResult;
   } catch {
     return null;
   }
+  storeProbe(pythonPath, result);
+  return result;
 };
 
+const VERSION_PATTERN = /^(\d+)\.(\d+)$/;
+
 const isValidPython = (version: string | null): boolean => {
-  if (!version) {
-    return false;
-  }
-  const [major, minor] = version.split(".").map((part) => Number(part));
-  if (!Number.isFinite(major) || !Number.isFinite(minor)) {
+  const match = version ? VERSION_PATTERN.exec(version) : null;
+  if (!match) {
     return false;
   }
+  const major = Number(match[1]);
+  const minor = Number(match[2]);
   return major === 3 && (minor === 11 || minor === 12);
 };
 
-const getPythonInfo = (pythonPath: string, checkDeps: boolean): PythonInfo | null => {
+// Standard Windows installs put python.exe directly in a "PythonXY"
+// directory (e.g. ".../Python312/python.exe"), which already gives the version.
+const versionFromPath = (pythonPath: string): string | null => {
+  const match = /^Python(\d)(\d+)$/i.exec(path.basename(path.dirname(pythonPath)));
+  return match ? `${match[1]}.${match[2]}` : null;
+};
+
+const getPythonInfo = async (
+  pythonPath: string,
+  checkDeps: boolean,
+  signal?: AbortSignal,
+): Promise<PythonInfo | null> => {
   if (!fs.existsSync(pythonPath)) {
     return null;
   }
 
   if (!checkDeps) {
-    // Quick check: just version
-    const version = runPythonCheck(pythonPath, "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}')");
+    // Quick check: just version, taken from the install path or an earlier
+    // full probe when possible so no interpreter has to be started.
+    const version =
+      versionFromPath(pythonPath) ??
+      getCachedProbe(pythonPath)?.version ??
+      (await runPythonCheck(
+        pythonPath,
+        "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}')",
+        signal,
+      ));
     if (!isValidPython(version)) {
       return null;
     }
@@ -112,7 +243,7 @@ const getPythonInfo = (pythonPath: string, checkDeps: boolean): PythonInfo | nul
   }
 
   // Full check: version + all deps in one call
-  const result = getAllPythonInfo(pythonPath);
+  const result = await getAllPythonInfo(pythonPath, signal);
   if (!result || !isValidPython(result.version)) {
     return null;
   }
@@ -129,10 +260,10 @@ const getPythonInfo = (pythonPath: string, checkDeps: boolean): PythonInfo | nul
 export const getPythonInfoForExecutable = (
   pythonPath: string,
   checkDeps: boolean,
-): PythonInfo | null => getPythonInfo(pythonPath, checkDeps);
+): Promise<PythonInfo | null> => getPythonInfo(pythonPath, checkDeps);
 
 export const resolveVenvPython = (venvRoot: string): string => {
-  return process.platform === "win32"
+  return IS_WINDOWS
     ? path.join(venvRoot, "Scripts", "python.exe")
     : path.join(venvRoot, "bin", "python");
 };
@@ -153,6 +284,23 @@ const findEnvPython = (): string | null => {
   return null;
 };
 
+// An activated virtualenv or conda env (e.g. when launched from a dev shell).
+const findActiveEnvPython = (): string | null => {
+  const candidates = [
+    process.env.VIRTUAL_ENV && resolveVenvPython(process.env.VIRTUAL_ENV),
+    process.env.CONDA_PREFIX &&
+      (IS_WINDOWS
+        ? path.join(process.env.CONDA_PREFIX, "python.exe")
+        : path.join(process.env.CONDA_PREFIX, "bin", "python")),
+  ];
+  for (const candidate of candidates) {
+    if (candidate && fs.existsSync(candidate)) {
+      return candidate;
+    }
+  }
+  return null;
+};
+
 const findVenvPython = (appRoot: string): string | null => {
   const searchPaths = [
     path.join(appRoot, ".venv", "Scripts", "python.exe"),
@@ -167,29 +315,70 @@ const findVenvPython = (appRoot: string): string | null => {
   return null;
 };
 
+// Walks PATH in-process (first match wins, as with `where`/`which`) rather
+// than spawning a lookup command.
 const findPathPython = (): string | null => {
-  const command = process.platform === "win32" ? "where" : "which";
-  try {
-    const output = execFileSync(command, ["python"], { encoding: "utf-8" }).trim();
-    const first = output.split(/\r?\n/)[0];
-    if (first && fs.existsSync(first)) {
-      return first;
+  const executable = IS_WINDOWS ? "python.exe" : "python";
+  for (const entry of (process.env.PATH ?? "").split(path.delimiter)) {
+    const dir = entry.replace(/^"(.*)"$/, "$1");
+    if (!dir) {
+      continue;
+    }
+    const candidate = path.join(dir, executable);
+    try {
+      if (fs.statSync(candidate).isFile()) {
+        fs.accessSync(candidate, fs.constants.X_OK);
+        return candidate;
+      }
+    } catch {
+      continue;
     }
-  } catch {
-    return null;
   }
   return null;
 };
 
+const PY_LAUNCHER_VERSIONS = ["3.12", "3.11"];
+const PY_LAUNCHER_TIMEOUT_MS = 10000;
+
+// Parses `py -0p` output, e.g. " -V:3.12 *  C:\...\python.exe" (newer
+// launchers) or " -3.12-64  C:\...\python.exe *" (older ones); "*" marks
+// the default install.
+const PY_LIST_LINE = /^\s*-(?:V:)?(\d+\.\d+)\S*\s+(?:\*\s+)?(.+?)(?:\s+\*)?\s*$/;
+
 const findPyLauncher = (): string | null => {
-  if (process.platform !== "win32") {
+  if (!IS_WINDOWS) {
     return null;
   }
-  for (const version of ["3.12", "3.11"]) {
+  // One `py -0p` call lists every registered install with its path.
+  try {
+    const output = execFileSync("py", ["-0p"], {
+      encoding: "utf-8",
+      windowsHide: true,
+      timeout: PY_LAUNCHER_TIMEOUT_MS,
+    });
+    const installs = new Map<string, string>();
+    for (const line of output.split(/\r?\n/)) {
+      const match = PY_LIST_LINE.exec(line);
+      if (match && !installs.has(match[1])) {
+        installs.set(match[1], match[2]);
+      }
+    }
+    for (const version of PY_LAUNCHER_VERSIONS) {
+      const executable = installs.get(version);
+      if (executable && fs.existsSync(executable)) {
+        return executable;
+      }
+    }
+    return null;
+  } catch {
+    // Launcher too old for -0p (or it failed); ask per version instead.
+  }
+  for (const version of PY_LAUNCHER_VERSIONS) {
     try {
       const output = execFileSync("py", [`-${version}`, "-c", "import sys; print(sys.executable)"] , {
         encoding: "utf-8",
         windowsHide: true,
+        timeout: PY_LAUNCHER_TIMEOUT_MS,
       }).trim();
       if (output && fs.existsSync(output)) {
         return output;
@@ -202,7 +391,7 @@ const findPyLauncher = (): string | null => {
 };
 
 const findCommonInstall = (): string | null => {
-  if (process.platform !== "win32") {
+  if (!IS_WINDOWS) {
     return null;
   }
   const localAppData = process.env.LOCALAPPDATA ?? "";
@@ -215,56 +404,90 @@ const findCommonInstall = (): string | null => {
   ].filter(Boolean) as string[];
 
   for (const base of candidates) {
-    if (!fs.existsSync(base)) {
+    // A single directory read answers both "is python.exe here" and "which
+    // PythonXY subdirectories exist"; a missing base simply fails to read.
+    let entries: fs.Dirent[];
+    try {
+      entries = fs.readdirSync(base, { withFileTypes: true });
+    } catch {
       continue;
     }
-    const direct = path.join(base, "python.exe");
-    if (fs.existsSync(direct)) {
-      return direct;
+    if (entries.some((entry) => entry.isFile() && entry.name.toLowerCase() === "python.exe")) {
+      return path.join(base, "python.exe");
     }
-    try {
-      const subdirs = fs.readdirSync(base, { withFileTypes: true });
-      for (const sub of subdirs) {
-        if (sub.isDirectory() && sub.name.startsWith("Python")) {
-          const candidate = path.join(base, sub.name, "python.exe");
-          if (fs.existsSync(candidate)) {
-            return candidate;
-          }
+    for (const sub of entries) {
+      if (sub.isDirectory() && sub.name.startsWith("Python")) {
+        const candidate = path.join(base, sub.name, "python.exe");
+        if (fs.existsSync(candidate)) {
+          return candidate;
         }
       }
-    } catch {
-      continue;
     }
   }
   return null;
 };
 
-export const findPython = (appRoot: string, checkDeps = true): PythonInfo => {
-  const finders = [
-    findEnvPython,
-    () => findVenvPython(appRoot),
-    findPathPython,
-    findPyLauncher,
-    findCommonInstall,
+// System-wide finder results only change if Python is installed or removed
+// while the app is running, so a repeat findPython() call (e.g. after
+// installing backend deps) does not spawn `py`, walk PATH or read install
+// directories again.
+const finderCache = new Map<() => string | null, string | null>();
+
+const cachedFinder = (finder: () => string | null) => (): string | null => {
+  if (!finderCache.has(finder)) {
+    finderCache.set(finder, finder());
+  }
+  return finderCache.get(finder) ?? null;
+};
+
+export const clearPythonFinderCache = (): void => {
+  finderCache.clear();
+};
+
+export const findPython = async (appRoot: string, checkDeps = true): Promise<PythonInfo> => {
+  // The first group only reads the environment and the filesystem. The second
+  // starts `py`, which blocks, so it is only consulted once nothing in the
+  // first group qualified.
+  const finderGroups = [
+    [findEnvPython, findActiveEnvPython, () => findVenvPython(appRoot), cachedFinder(findPathPython)],
+    [cachedFinder(findPyLauncher), cachedFinder(findCommonInstall)],
   ];
 
+  // Once a candidate qualifies, the probes still running are killed.
+  const controller = new AbortController();
+  const probed = new Set<string>();
   let found: PythonInfo | null = null;
 
-  for (const finder of finders) {
-    const candidate = finder();
-    if (!candidate) {
-      continue;
-    }
-    const info = getPythonInfo(candidate, checkDeps);
-    if (!info) {
-      continue;
-    }
-    if (!checkDeps || (info.hasTorch && info.hasNemo && info.hasGrpc)) {
-      return info;
-    }
-    if (!found) {
-      found = info;
+  try {
+    for (const finders of finderGroups) {
+      // A group's candidates are probed at once but results are taken in
+      // finder order, so an earlier finder keeps priority over a faster
+      // later probe.
+      const candidates = new Set(
+        finders
+          .map((finder) => finder())
+          .filter((candidate): candidate is string => candidate !== null && !probed.has(candidate)),
+      );
+      const probes = [...candidates].map((candidate) => {
+        probed.add(candidate);
+        return getPythonInfo(candidate, checkDeps, controller.signal);
+      });
+
+      for (const probe of probes) {
+        const info = await probe;
+        if (!info) {
+          continue;
+        }
+        if (!checkDeps || (info.hasTorch && info.hasNemo && info.hasGrpc)) {
+          return info;
+        }
+        if (!found) {
+          found = info;
+        }
+      }
     }
+  } finally {
+    controller.abort();
   }
 
   if (found) {
@@ -87,9 +87,6 @@ const getSettingsPath = () => path.join(app.getPath("userData"), SETTINGS_FILE);
 export const loadSettings = (): AppSettings => {
   const filePath = getSettingsPath();
   try {
-    if (!fs.existsSync(filePath)) {
-      return { ...DEFAULT_SETTINGS };
-    }
     const raw = fs.readFileSync(filePath, "utf-8");
     const parsed = JSON.parse(raw) as Partial<AppSettings>;
     return {
@@ -101,7 +98,10 @@ export const loadSettings = (): AppSettings => {
       overlay: { ...DEFAULT_SETTINGS.overlay, ...parsed.overlay },
     };
   } catch (error) {
-    console.warn("Failed to load settings, using defaults", error);
+    // First run: no settings file yet.
+    if ((error as NodeJS.ErrnoException).code !== "ENOENT") {
+      console.warn("Failed to load settings, using defaults", error);
+    }
     return { ...DEFAULT_SETTINGS };
   }
 };
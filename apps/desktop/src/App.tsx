@@ -4,6 +4,29 @@ import { getBridge } from "./bridge";
 import "./App.css";
 
 const DEFAULT_STATUS: BackendStatus = { ready: false, detail: "Initializing..." };
+const MAX_LOG_LINES = 200;
+
+// Log lines are keyed by a running id: once the view is full, dropping the
+// oldest line would otherwise shift every index-based key and re-create all
+// rendered lines on each batch.
+type LogLine = { id: number; text: string };
+
+let nextLogId = 0;
+
+// History entries carry a stable id so prepending a transcript only mounts the
+// new row instead of re-keying (and re-creating) every row below it.
+type HistoryEntry = { id: number; text: string };
+
+let nextHistoryId = 0;
+
+const toHistoryEntry = (text: string): HistoryEntry => ({ id: nextHistoryId++, text });
+
+// Keeps the current entries (and so skips the re-render) when a refresh
+// returns the same transcripts that are already shown.
+const mergeHistory = (prev: HistoryEntry[], items: string[]): HistoryEntry[] =>
+  prev.length === items.length && prev.every((entry, index) => entry.text === items[index])
+    ? prev
+    : items.map(toHistoryEntry);
 
 const formatHotkey = (preset: HotkeyPreset): string => {
   switch (preset) {
@@ -52,8 +75,8 @@ const statusTone = (state: DictationState): string => {
 function App() {
   const [status, setStatus] = useState<BackendStatus>(DEFAULT_STATUS);
   const [dictationState, setDictationState] = useState<DictationState>("IDLE");
-  const [history, setHistory] = useState<string[]>([]);
-  const [logs, setLogs] = useState<string[]>([]);
+  const [history, setHistory] = useState<HistoryEntry[]>([]);
+  const [logs, setLogs] = useState<LogLine[]>([]);
   const [showLogs, setShowLogs] = useState(false);
   const [cachePath, setCachePath] = useState<string>("");
   const [settings, setSettings] = useState<AppSettings | null>(null);
@@ -65,9 +88,14 @@ function App() {
   useEffect(() => {
     const bridge = getBridge();
 
-    const unsubLog = bridge.onBackendLog((line) => {
-      setLogs((prev) => [...prev.slice(-200), line]);
-      setLastLog(line);
+    const unsubLog = bridge.onBackendLog((lines) => {
+      if (lines.length === 0) {
+        return;
+      }
+      // One state update per batch rather than per line.
+      const added = lines.map((text) => ({ id: nextLogId++, text }));
+      setLogs((prev) => [...prev, ...added].slice(-MAX_LOG_LINES));
+      setLastLog(lines[lines.length - 1]);
     });
     const unsubStatus = bridge.onBackendStatus((payload) => {
       setStatus(payload);
@@ -77,7 +105,7 @@ function App() {
     });
     const unsubState = bridge.onDictationState((payload) => setDictationState(payload.state));
     const unsubTranscript = bridge.onTranscript((payload) => {
-      setHistory((prev) => [payload.text, ...prev].slice(0, 10));
+      setHistory((prev) => [toHistoryEntry(payload.text), ...prev].slice(0, 10));
     });
     const unsubInstall = bridge.onInstallStatus((payload) => {
       setStatus({ ready: false, detail: payload.status });
@@ -87,7 +115,10 @@ function App() {
     });
     const unsubCache = bridge.onCachePath((payload) => setCachePath(payload.path));
 
-    bridge.requestHistory().then(setHistory).catch(() => null);
+    bridge
+      .requestHistory()
+      .then((items) => setHistory((prev) => mergeHistory(prev, items)))
+      .catch(() => null);
     bridge.getSettings().then(setSettings).catch(() => null);
     bridge.requestCachePath().then(setCachePath).catch(() => null);
 
@@ -103,8 +134,12 @@ function App() {
   }, []);
 
   useEffect(() => {
+    // Only listen while the settings modal is open.
+    if (!showSettings) {
+      return;
+    }
     const handleEscape = (e: KeyboardEvent) => {
-      if (e.key === 'Escape' && showSettings) {
+      if (e.key === 'Escape') {
         setShowSettings(false);
       }
     };
@@ -147,7 +182,7 @@ function App() {
             {logs.length === 0 ? (
               <p className="log-empty">No backend output yet.</p>
             ) : (
-              logs.map((line, index) => <p key={`${line}-${index}`}>{line}</p>)
+              logs.map((line) => <p key={line.id}>{line.text}</p>)
             )}
           </div>
         </section>
@@ -249,7 +284,14 @@ function App() {
             <h2>Recent transcripts</h2>
             <p>Tap copy to paste instantly.</p>
           </div>
-          <button className="ghost" onClick={() => getBridge().requestHistory().then(setHistory)}>
+          <button
+            className="ghost"
+            onClick={() =>
+              getBridge()
+                .requestHistory()
+                .then((items) => setHistory((prev) => mergeHistory(prev, items)))
+            }
+          >
             Refresh
           </button>
         </div>
@@ -260,12 +302,12 @@ function App() {
           </div>
         ) : (
           <div className="history-list">
-            {recentHistory.map((item, index) => (
-              <div className="history-item" key={`${item}-${index}`}>
-                <p>{item}</p>
+            {recentHistory.map((item) => (
+              <div className="history-item" key={item.id}>
+                <p>{item.text}</p>
                 <button
                   className="ghost small"
-                  onClick={() => navigator.clipboard.writeText(item)}
+                  onClick={() => navigator.clipboard.writeText(item.text)}
                 >
                   Copy
                 </button>
@@ -40,7 +40,7 @@ export type AppSettings = {
 declare global {
   interface Window {
     parakey: {
-      onBackendLog: (callback: (line: string) => void) => () => void;
+      onBackendLog: (callback: (lines: string[]) => void) => () => void;
       onBackendStatus: (callback: (payload: BackendStatus) => void) => () => void;
       onDictationState: (callback: (payload: { state: DictationState }) => void) => () => void;
       onTranscript: (callback: (payload: { text: string }) => void) => () => void;
@@ -22,6 +22,9 @@ class BackendConfig:
     # Audio settings
     sample_rate_hz: int = 16000
 
+    # Shut down once stdin reaches EOF, i.e. when the parent process is gone
+    exit_on_stdin_close: bool = False
+
 
 def load_config_from_env() -> BackendConfig:
     """Load configuration from environment variables.
@@ -40,6 +43,7 @@ def load_config_from_env() -> BackendConfig:
         ),
         device=os.getenv("PARAKEY_DEVICE"),
         sample_rate_hz=int(os.getenv("PARAKEY_SAMPLE_RATE", "16000")),
+        exit_on_stdin_close=os.getenv("PARAKEY_EXIT_ON_STDIN_CLOSE") == "1",
     )
 
 
@@ -38,7 +38,9 @@ class InferenceEngine:
         """
         self._config = config
         self._model_loader = None
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="parakey-inference"
+        )
         self._loaded = False
 
     @property
@@ -71,10 +73,10 @@ class InferenceEngine:
             )
             self._model_loader.load()
             self._loaded = True
-            logger.info(f"Inference engine ready on {self._model_loader.device}")
+            logger.info("Inference engine ready on %s", self._model_loader.device)
 
         except Exception as e:
-            logger.error(f"Failed to load model: {e}")
+            logger.error("Failed to load model: %s", e)
             raise
 
     def unload_model(self) -> None:
@@ -117,7 +119,7 @@ class InferenceEngine:
         if not self._loaded:
             raise RuntimeError("Model not loaded - call load_model() first")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             self._executor,
             self._transcribe_sync,
@@ -172,7 +174,7 @@ class InferenceEngine:
                     )
                 )
             else:
-                logger.error(f"Transcription failed: {e}")
+                logger.error("Transcription failed: %s", e)
                 events.append(
                     EngineEvent(
                         kind="error",
@@ -181,7 +183,7 @@ class InferenceEngine:
                 )
 
         except Exception as e:
-            logger.error(f"Transcription failed: {e}")
+            logger.error("Transcription failed: %s", e)
             events.append(
                 EngineEvent(
                     kind="error",
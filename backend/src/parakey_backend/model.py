@@ -76,7 +76,7 @@ def get_device() -> str:
     """
     if torch.cuda.is_available():
         device_name = torch.cuda.get_device_name(0)
-        logger.info(f"CUDA available: {device_name}")
+        logger.info("CUDA available: %s", device_name)
         return "cuda"
 
     raise ModelLoadError(
@@ -159,18 +159,18 @@ class ModelLoader:
 
             # Show cache info
             cache_info = get_model_cache_info()
-            logger.info(f"Model cache directory: {cache_info['cache_dir']}")
+            logger.info("Model cache directory: %s", cache_info["cache_dir"])
 
             if cache_info["model_cached"]:
                 logger.info(
-                    f"Model already cached ({cache_info['cache_size_mb']:.1f} MB)"
+                    "Model already cached (%.1f MB)", cache_info["cache_size_mb"]
                 )
             else:
                 logger.info("Model not cached - will download (~1.2 GB)")
                 logger.info("Download progress will be shown below...")
 
-            logger.info(f"Loading model: {self._model_name}")
-            logger.info(f"Device: {self._device}")
+            logger.info("Loading model: %s", self._model_name)
+            logger.info("Device: %s", self._device)
 
             # Load the model from HuggingFace
             # HuggingFace Hub will show download progress automatically
@@ -184,7 +184,7 @@ class ModelLoader:
             self._model.eval()
 
             self._loaded = True
-            logger.info(f"Model loaded successfully on {self._device}")
+            logger.info("Model loaded successfully on %s", self._device)
 
         except ImportError as e:
             raise ModelLoadError(
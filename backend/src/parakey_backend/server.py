@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import grpc
@@ -15,6 +19,10 @@ from parakey_proto import dictation_pb2_grpc
 
 logger = logging.getLogger("parakey.backend")
 
+# How long a graceful shutdown may take after the parent has gone away before
+# the process exits regardless (model loading cannot be interrupted).
+PARENT_EXIT_GRACE_S = 10.0
+
 
 class BackendServer:
     """ParaKey backend gRPC server."""
@@ -55,19 +63,21 @@ class BackendServer:
         Starts the gRPC server first so clients can connect and check health,
         then loads the model. GetHealth returns ready=false until loading completes.
         """
-        logger.info(f"Starting ParaKey backend (mode: {self._config.mode})")
+        logger.info("Starting ParaKey backend (mode: %s)", self._config.mode)
 
         # Start gRPC server first so health checks work during model loading
         self._server = self._create_server()
         await self._server.start()
         logger.info(
-            f"Backend listening on {self._config.host}:{self._config.port}"
+            "Backend listening on %s:%s", self._config.host, self._config.port
         )
 
         # Load the model in a thread so gRPC can serve health checks during loading
         logger.info("Loading model...")
         await asyncio.to_thread(self._service.load_model)
-        logger.info(f"Model loaded on {self._service.engine.device}")
+        # The desktop app watches for this line to re-check health right away
+        # (BACKEND_READY_MARKER in electron/backend.ts); keep the wording.
+        logger.info("Model loaded on %s", self._service.engine.device)
 
     async def stop(self) -> None:
         """Stop the backend server gracefully."""
@@ -87,24 +97,64 @@ class BackendServer:
         if self._server is not None:
             await self._server.wait_for_termination()
 
+    def _watch_stdin(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Request shutdown once stdin closes, then force exit after a grace period.
+
+        The desktop app holds the write end of our stdin, so EOF means it has
+        exited, including when it crashed without stopping the backend.
+
+        Reads the raw descriptor: a thread blocked in sys.stdin.buffer would
+        hold its lock and abort interpreter shutdown while stdin is still open.
+        """
+        try:
+            fd = sys.stdin.fileno()
+            while os.read(fd, 4096):
+                pass
+        except (AttributeError, OSError, ValueError):
+            return
+
+        logger.info("Parent process exited; shutting down")
+        try:
+            loop.call_soon_threadsafe(self._shutdown_event.set)
+        except RuntimeError:
+            # The loop is already closed, so shutdown is under way.
+            return
+
+        threading.Event().wait(PARENT_EXIT_GRACE_S)
+        logger.warning("Shutdown did not finish in time; exiting")
+        os._exit(1)
+
     async def run(self) -> None:
         """Run the server until interrupted.
 
         This method handles SIGINT and SIGTERM for graceful shutdown.
         """
-        # Setup signal handlers
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+
+        # Only model loading goes through the default executor (inference has
+        # its own), so cap it instead of letting asyncio size it by CPU count.
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=2, thread_name_prefix="parakey-backend")
+        )
 
+        # Setup signal handlers
         def signal_handler():
             logger.info("Received shutdown signal")
             self._shutdown_event.set()
 
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            try:
+        # Windows event loops don't support add_signal_handler; there the
+        # desktop app stops the backend by terminating the process tree.
+        if sys.platform != "win32":
+            for sig in (signal.SIGINT, signal.SIGTERM):
                 loop.add_signal_handler(sig, signal_handler)
-            except NotImplementedError:
-                # Windows doesn't support add_signal_handler
-                pass
+
+        if self._config.exit_on_stdin_close:
+            threading.Thread(
+                target=self._watch_stdin,
+                args=(loop,),
+                name="parakey-stdin-watch",
+                daemon=True,
+            ).start()
 
         try:
             await self.start()
@@ -118,11 +168,14 @@ class BackendServer:
                 return_when=asyncio.FIRST_COMPLETED,
             )
 
-            # Cancel pending tasks
-            for task in pending:
-                task.cancel()
+            # Only the shutdown waiter is cancelled: cancelling
+            # wait_for_termination() also cancels grpc's shutdown future, which
+            # makes stop() below raise CancelledError. Stopping the server
+            # completes it instead.
+            if shutdown_task in pending:
+                shutdown_task.cancel()
                 try:
-                    await task
+                    await shutdown_task
                 except asyncio.CancelledError:
                     pass
 
@@ -78,7 +78,7 @@ class DictationService(dictation_pb2_grpc.DictationServiceServicer):
                     break
 
         except grpc.aio.AioRpcError as e:
-            logger.error(f"Client stream error: {e}")
+            logger.error("Client stream error: %s", e)
             yield dictation_pb2.DictationEvent(
                 error=dictation_pb2.ErrorStatus(
                     code="STREAM_ERROR",
@@ -88,7 +88,7 @@ class DictationService(dictation_pb2_grpc.DictationServiceServicer):
             return
 
         # Process audio and generate events
-        logger.debug(f"Processing {len(audio_frames)} audio frames")
+        logger.debug("Processing %d audio frames", len(audio_frames))
 
         events = await self._engine.process_audio_stream(
             audio_frames, sample_rate
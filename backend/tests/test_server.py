@@ -0,0 +1,72 @@
+"""Tests for BackendServer shutdown paths."""
+
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Runs the real server loop with a stub engine so no model is loaded.
+SERVER_SCRIPT = """
+import asyncio, logging
+from parakey_backend.config import BackendConfig
+from parakey_backend.server import BackendServer
+
+class StubEngine:
+    device = "stub"
+    def load_model(self): pass
+    def unload_model(self): pass
+
+logging.basicConfig(level=logging.INFO)
+server = BackendServer(BackendConfig(port=0, exit_on_stdin_close=True))
+server.service._engine = StubEngine()
+asyncio.run(server.run())
+"""
+
+
+def _start_server() -> subprocess.Popen[str]:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            [str(ROOT / "backend" / "src"), str(ROOT / "shared" / "src")]
+        ),
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-c", SERVER_SCRIPT],
+        stdin=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    assert process.stderr is not None
+    for line in process.stderr:
+        if "Model loaded on" in line:
+            return process
+    process.kill()
+    pytest.fail(f"server exited before loading (code {process.wait()})")
+
+
+def test_shuts_down_when_stdin_closes() -> None:
+    process = _start_server()
+    assert process.stdin is not None
+    process.stdin.close()
+
+    assert process.wait(timeout=15) == 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX signals")
+def test_sigterm_with_stdin_open_exits_cleanly() -> None:
+    process = _start_server()
+    process.send_signal(signal.SIGTERM)
+
+    try:
+        assert process.wait(timeout=15) == 0
+    finally:
+        assert process.stdin is not None
+        process.stdin.close()